@@ -1,37 +1,141 @@
 # pandas plus plotly
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 # Dash 
 from dash import Dash, dcc, html, Input, Output, State, no_update
 import numpy as np
 import dash_bootstrap_components as dbc
-
-
-# load and prep the data 
-raw_global = pd.read_csv("merged_global.csv")
-raw_global["Date"] = pd.to_datetime(raw_global[["year", "month"]].assign(day=15))
-raw_hemi = pd.read_csv("hemispheric_merged.csv")
-raw_hemi["Date"] = pd.to_datetime(raw_hemi[["year", "month"]].assign(day=15))
-# getting the  seasons according to the month they belong
-def tag_season(month):
-    return {12: "DJF", 1: "DJF", 2: "DJF",
-            3: "MAM", 4: "MAM", 5: "MAM",
-            6: "JJA", 7: "JJA", 8: "JJA",
-            9: "SON", 10: "SON", 11: "SON"}[month]
-
-raw_global["Season"] = raw_global["month"].apply(tag_season)
-# Donw a bit of aggregation for seasonal views ( useful for later)
-seasonal_avg = (
-    raw_global.groupby(["year", "Season"])
-    .mean(numeric_only=True)
-    .reset_index()
-    .assign(Season_Order=lambda d: d["Season"].map({"DJF": 0, "MAM": 1, "JJA": 2, "SON": 3}))
-    .sort_values(["year", "Season_Order"])
+from flask_caching import Cache
+from functools import lru_cache
+import base64
+import gzip
+from itertools import combinations
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# copy-on-write so window slices stay lazy views unless something writes to them
+# (always on from pandas 3, where setting the option is deprecated; opt-in on the 2.x the docker image gets)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# every callback response goes through plotly's json encoder, orjson does it much faster than the stdlib one
+pio.json.config.default_engine = "orjson"
+
+# load and prep the data (pyarrow parser is multithreaded and a lot quicker on startup)
+# the normalized norm_* columns are only plotted / correlated to 2 decimals, so float32 is plenty and halves the bytes
+# (raw measurements stay float64, they're what the hover tooltips and the csv export show as-is; year / month fit in int16 / int8)
+def read_climate_csv(path):
+    df = pd.read_csv(path, engine="pyarrow")
+    return df.astype({"year": "int16", "month": "int8", **{c: "float32" for c in df.columns if c.startswith("norm_")}})
+
+raw_global = read_climate_csv("merged_global.csv")
+raw_global["Date"] = pd.to_datetime(dict(year=raw_global["year"], month=raw_global["month"], day=15))
+raw_hemi = read_climate_csv("hemispheric_merged.csv")
+raw_hemi["Date"] = pd.to_datetime(dict(year=raw_hemi["year"], month=raw_hemi["month"], day=15))
+
+# yearly means for the hemisphere animation, the csv never changes so group it once and keep it
+@lru_cache(maxsize=1)
+def load_hemi():
+    return raw_hemi.groupby("year").mean(numeric_only=True).reset_index().sort_values("year")
+
+# per hemisphere: (years, float32 matrix of its norm_* columns, column name -> matrix column)
+# built once here so the animation callback never touches pandas
+def hemi_arrays(hemi):
+    grouped = load_hemi()
+    cols = [c for c in grouped.columns if c.startswith("norm_") and hemi in c]
+    return grouped["year"].to_numpy(), grouped[cols].to_numpy(dtype=np.float32), {c: j for j, c in enumerate(cols)}
+
+HEMI = {hemi: hemi_arrays(hemi) for hemi in ("north", "south")}
+
+# getting the  seasons according to the month they belong (index by month number, slot 0 unused)
+SEASON_LUT = np.array(["", "DJF", "DJF", "MAM", "MAM", "MAM", "JJA", "JJA", "JJA", "SON", "SON", "SON", "DJF"])
+
+# ordered categorical so the seasons sort DJF -> SON by themselves and groupby works on int codes
+raw_global["Season"] = pd.Categorical(
+    SEASON_LUT[raw_global["month"].to_numpy()], categories=["DJF", "MAM", "JJA", "SON"], ordered=True
 )
+# global events marked on the chart: (year, label, date for the monthly view, label for the seasonal view)
+POLICY_EVENTS = [
+    (year, label, pd.Timestamp(year=year, month=month, day=1), f"{SEASON_LUT[month]} {year}")
+    for year, label, month in [(1997, "Kyoto Protocol", 12), (2015, "Paris Agreement", 12), (2020, "COVID Drop", 4)]
+]
+# both frames are sorted by year, so a year window is just a positional slice found by binary search
+raw_global = raw_global.sort_values(["year", "month"]).reset_index(drop=True)
+
+# the measurement columns (raw + normalized), the only ones the seasonal view ever averages
+INDICATOR_COLS = list(raw_global.select_dtypes("floating").columns)
+# Donw a bit of aggregation for seasonal views ( useful for later)
+# (sorted on the ordered Season categorical, so DJF always comes first in a year even if the data starts mid-year)
+seasonal_avg = raw_global.groupby(["year", "Season"], sort=True, observed=True)[INDICATOR_COLS].mean().reset_index()
+# x axis labels for the seasonal view ("DJF 1997"), built once here rather than on every callback
+seasonal_avg["X_seasonal"] = seasonal_avg["Season"].astype(str) + " " + seasonal_avg["year"].astype(str)
+
+global_years = raw_global["year"].to_numpy()
+seasonal_years = seasonal_avg["year"].to_numpy()
+
+def year_bounds(years, year_range):
+    # years are ints, so "<= end" is the same as "< end + 1" and both bounds come from one search
+    lo, hi = np.searchsorted(years, [year_range[0], year_range[1] + 1])
+    return lo, hi
+
+def year_slice(df, years, year_range):
+    lo, hi = year_bounds(years, year_range)
+    return df.iloc[lo:hi]
+
+# norm_* indicators of each view as float32 matrices, so the correlation summary
+# picks indicator columns by offset instead of via DataFrame selection
+NORM_COLS = [c for c in raw_global.columns if c.startswith("norm_")]
+NORM_IDX = {c: j for j, c in enumerate(NORM_COLS)}
+global_norm = raw_global[NORM_COLS].to_numpy(dtype=np.float32)
+seasonal_norm = seasonal_avg[NORM_COLS].to_numpy(dtype=np.float32)
+
+# running sums of every indicator and of every pairwise product (row 0 is zeros), so the correlation
+# over any year window is a few subtractions instead of a pass over the rows
+# (a nan carries forward through the sums, so a column is only usable up to its first gap)
+def prefix_moments(norm):
+    x = norm.astype(np.float64)
+    s1 = np.concatenate([np.zeros((1, x.shape[1])), x.cumsum(axis=0)])
+    s2 = np.concatenate([np.zeros((1, x.shape[1], x.shape[1])), np.einsum("ni,nj->nij", x, x).cumsum(axis=0)])
+    return s1, s2
+
+global_moments = prefix_moments(global_norm)
+seasonal_moments = prefix_moments(seasonal_norm)
+
+# Pearson r matrix of the indicator columns idx over rows lo:hi, from the prefix sums above
+def window_corr(moments, lo, hi, idx):
+    s1, s2 = moments
+    n = hi - lo
+    sx = s1[hi, idx] - s1[lo, idx]
+    sxy = s2[hi][np.ix_(idx, idx)] - s2[lo][np.ix_(idx, idx)]
+    cov = n * sxy - np.outer(sx, sx)
+    d = np.sqrt(np.diag(cov))
+    return cov / np.outer(d, d)
+
+# the monthly window is used by both the global figure and the csv export, keep it per slider position
+@lru_cache(maxsize=64)
+def global_window(start, end):
+    return year_slice(raw_global, global_years, (start, end))
+
 # intializing the dash app now 
 app = Dash(__name__, external_stylesheets=[dbc.themes.FLATLY], suppress_callback_exceptions=True)
 app.title = "Climate Dashboard"
+# memoizes the figure builders across requests, users flip back and forth between the same settings a lot
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
+
+# plotly templates for the theme toggle, resolved to plain dicts once so they can be dropped into cached figure dicts
+THEME_TEMPLATES = {
+    "Light": pio.templates["plotly_white"].to_plotly_json(),
+    "Dark": pio.templates["plotly_dark"].to_plotly_json(),
+}
+
+def theme_template(theme):
+    return THEME_TEMPLATES["Dark"] if theme == "Dark" else THEME_TEMPLATES["Light"]
+
+# cached figure dicts are already JSON-ready, so the template goes into a shallow copy of the layout
+# instead of re-validating everything through go.Figure on each call
+def with_theme(fig, theme):
+    return {**fig, "layout": {**fig["layout"], "template": theme_template(theme)}}
 
 # deciding heading and structure of the top level layout of the dashboard
 app.layout = dbc.Container([
@@ -57,10 +161,48 @@ app.layout = dbc.Container([
         ], width=12)
     ]),
 # for downloading the csv 
-    dcc.Download(id="download-csv")
+    dcc.Download(id="download-csv"),
+# plotly templates for the client-side theme swap
+    dcc.Store(id="theme-templates", data=THEME_TEMPLATES)
 ], fluid=True, style={"minWidth": "1100px", "height": "100vh", "padding": "10px"})
 
 
+# Explanation box to make it simpler to undertsand the data for users
+# (never changes, so it is built once and sits in the layout instead of coming back from every callback)
+EXPLANATION = html.Div([
+
+    html.P("🌍 This dashboard compares key climate indicators that reflect human impact on the Earth’s climate system."),
+    html.Ul([
+        html.Li(["🌱",html.B("CO₂ Emissions"),": Carbon dioxide ( e.g., from fossil fuels) traps heat in the atmosphere. More CO₂ → more warming."]),
+        html.Li(["🌡️",html.B("Temperature Anomalies"),": How much temperatures deviate from historical normals, indicating warming trends."]),
+        html.Li(["🌊",html.B("Sea Level Changes"),": Driven by ice melt and thermal expansion of seawater as it warms."])
+    ]),
+
+    html.P("You are viewing normalized values (range from 0 to 1), which means each climate indicator—CO₂ emissions (Mt), temperature anomalies (°C), and sea level (mm)—has been scaled to the same range for easy comparison."),
+    html.P("➤ This allows you to directly compare trends, even though the original units are very different."),
+    html.P("➤ Hover over the lines to see the actual (raw) values for each year."),
+    html.P("➤ The graph highlights how these indicators have changed over time, focuses on the last 30 years."),
+    html.P([
+        "📍 Three key global events are marked on the chart:",
+        html.Ul([
+            html.Li([
+                html.B("Kyoto Protocol (Dec 1997): "),
+                "An international treaty committing industrialized countries to reduce emissions. You may notice a delayed but visible slowing in emission growth after this point."
+            ]),
+            html.Li([
+                html.B("Paris Agreement (Dec 2015): "),
+                "A global framework to limit warming to below 2°C. Although targets were set, the data shows only minor reductions or stabilization in trends after this agreement."
+            ]),
+            html.Li([
+                html.B("COVID Drop (Spring 2020): "),
+                "Global lockdowns may have led to temporary emissions drops and some irregularities in sea level due to the economic slowdown. These appear as short-term dips in the data."
+            ]),
+        ]),
+        "These annotations help you connect major global actions or disruptions to changes in the data. Look for temporary changes or delayed responses in the trendlines near these years."
+    ]),
+    html.P("➤ You can use the legend side of the chart to show or hide each indicator.")
+])
+
 # to switch the tabs here it is logic
 @app.callback(Output('tabs-content', 'children'), Input('tabs', 'value'))
 def switch_tab(selected_tab):
@@ -92,7 +234,7 @@ def switch_tab(selected_tab):
             dbc.Col([
                 dbc.Card([
                     dbc.CardHeader("📊 What You’re Seeing"),
-                    dbc.CardBody(id="explanation-box", style={
+                    dbc.CardBody(EXPLANATION, id="explanation-box", style={
                         "backgroundColor":"#eef2f3",
                         "borderRadius": "6px",
                         "fontSize": "15px"
@@ -105,7 +247,9 @@ def switch_tab(selected_tab):
                     min=raw_global['year'].min(), max=raw_global['year'].max(),
                     value=[1993, raw_global['year'].max()],
                     marks={str(y): str(y) for y in range(raw_global['year'].min(), raw_global['year'].max()+1, 5)},
-                    step=1
+                    step=1,
+                    # only report the range once the handle is let go, so a drag is one callback and not one per step
+                    updatemode="mouseup"
                 ),
 
                 html.Div(id="summary-panel", style={
@@ -158,6 +302,17 @@ def switch_tab(selected_tab):
             ], width=9)
         ])
 
+# checklist options per hemisphere never change, so both are built once here (everything is ticked by default)
+HEMI_OPTIONS = {
+    hemi: [
+        {"label": "CO₂ Anomaly", "value": f"norm_{hemi}_co2"},
+        {"label": "Land Temp Anomaly", "value": f"norm_{hemi}_land"},
+        {"label": "Land-Ocean Temp Anomaly", "value": f"norm_{hemi}_land_ocean"},
+        {"label": "Sea Level Anomaly", "value": f"norm_msl_{hemi}"},
+    ]
+    for hemi in ("north", "south")
+}
+HEMI_DEFAULTS = {hemi: [opt["value"] for opt in options] for hemi, options in HEMI_OPTIONS.items()}
 
 @app.callback(
     Output("hemi-checklist", "options"),
@@ -167,161 +322,169 @@ def switch_tab(selected_tab):
 def refresh_hemi_checklist(hemi):
     if hemi is None:
         return [], []
-    prefix = f"norm_{hemi}_"
-    options_map = {
-        f"{prefix}co2": "CO₂ Anomaly",
-        f"{prefix}land": "Land Temp Anomaly",
-        f"{prefix}land_ocean": "Land-Ocean Temp Anomaly",
-        f"norm_msl_{hemi}": "Sea Level Anomaly" 
-    }
-    options = [{"label": label, "value": key} for key, label in options_map.items()]
-    default_values = [opt["value"] for opt in options]
-    return options, default_values
-# Updates global graph explanation box and summary panel in real time
+    return HEMI_OPTIONS[hemi], HEMI_DEFAULTS[hemi]
+
+# dashed line + label for a policy event at x (the event date in Monthly view, its "DJF 1997" category in Seasonal)
+def policy_mark(x, label):
+    shape = dict(type="line", x0=x, x1=x, xref="x", y0=0, y1=1, yref="y domain", line=dict(color="gray", dash="dash"))
+    note = dict(x=x, y=1.05, yref="paper", text=label, showarrow=True, ax=0, ay=-30, font=dict(size=10))
+    return shape, note
+
+# every event's marks for both views, built once; callbacks only pick the ones in range
+POLICY_MARKS = {
+    "Monthly": {year: policy_mark(date, label) for year, label, date, _ in POLICY_EVENTS},
+    "Seasonal": {year: policy_mark(season_label, label) for year, label, _, season_label in POLICY_EVENTS},
+}
+
+# long monthly ranges get thinned to this many points per line before they go to the browser
+MAX_LINE_POINTS = 500
+
+# Largest-Triangle-Three-Buckets: which points of y to keep so the line still looks the same with only n_out points
+# (first and last always kept, then per bucket the point making the biggest triangle with the previous pick
+# and the next bucket's average). Returns a plain slice when there's nothing to thin.
+def lttb_keep(y, n_out):
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return slice(None)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+        cx, cy = (nlo + nhi - 1) / 2, y[nlo:nhi].mean()
+        xs = np.arange(lo, hi)
+        area = np.abs((a - cx) * (y[lo:hi] - y[a]) - (a - xs) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+# line colours for the global chart, in indicator order
+GLOBAL_COLORS = ['#0072B2', '#D55E00', '#009E73', '#CC79A7']
+
+# Raw value mapping for users to see when they hover tooltips
+RAW_MAPPING = {
+    'norm_co2': 'co2_anomaly',
+    'norm_land_ocean_temp': 'land_ocean_anomaly',
+    'norm_land_temp': 'land_anomaly',
+    'norm_sea_level': 'msl_mm'
+}
+
+# builds the global figure + correlation lines, cached on the callback inputs (theme is applied afterwards)
+@cache.memoize(timeout=300)
+def build_global_figure(selected, year_range, mode):
+    selected = list(selected)
+
+    # to get the correct time window i use filtering (only for the view we're actually showing)
+    if mode == "Monthly":
+        dff = global_window(*year_range)
+    else:
+        dff = year_slice(seasonal_avg, seasonal_years, year_range)
+
+    # only the columns the plot reads, no full copy of the window
+    sub = dff[["year"] + selected + [RAW_MAPPING[c] for c in selected if c in RAW_MAPPING]]
+
+    # time axis for either the month view mode selected or the seasonal one (both precomputed columns)
+    x = dff["Date"] if mode == "Monthly" else dff["X_seasonal"]
+
+    # Final filtered DataFrame for plotting (one combined NaN mask instead of dropna on a copy)
+    mask = ~sub.isna().any(axis=1).to_numpy()
+    plot_df = sub[mask].assign(X=x.to_numpy()[mask])
+
+    # Create the figure: one WebGL line per indicator straight from the arrays (no px wide-to-long melt),
+    # each trace carries just its own raw column for the hover tooltip
+    x_vals = plot_df["X"].to_numpy()
+    fig = go.Figure()
+    for k, col in enumerate(selected):
+        raw_col = RAW_MAPPING.get(col)
+        y_vals = plot_df[col].to_numpy()
+        keep = lttb_keep(y_vals, MAX_LINE_POINTS)
+        fig.add_trace(go.Scattergl(
+            x=x_vals[keep],
+            y=y_vals[keep],
+            mode="lines",
+            name=col,
+            legendgroup=col,
+            line=dict(color=GLOBAL_COLORS[k % len(GLOBAL_COLORS)]),
+            customdata=plot_df[raw_col].to_numpy()[keep] if raw_col else None,
+            hovertemplate=f"Indicator={col}<br>Year=%{{x}}<br>Normalized Value (0–1)=%{{y}}"
+                          + (f"<br>{raw_col}=%{{customdata}}" if raw_col else "") + "<extra></extra>"
+        ))
+    fig.update_layout(
+        title=f"Climate Trends Over Time ({mode})",
+        xaxis_title="Year",
+        yaxis_title="Normalized Value (0–1)",
+        legend_title_text="Indicator"
+    )
+
+
+    # Annotating global climate events in both Monthly and Seasonal modes (lines/labels prebuilt in POLICY_MARKS)
+    # and added in one update_layout instead of an add_vline/add_annotation round trip per event
+    if mode == "Monthly":
+        # Add annotation only if year is in selected range
+        marks = [POLICY_MARKS["Monthly"][year] for year, *_ in POLICY_EVENTS if year_range[0] <= year <= year_range[1]]
+    else:  # Seasonal mode
+        # seasonal labels on screen as a set, so each event check is O(1) instead of a scan of the column
+        shown_seasons = set(plot_df["X"].tolist())
+        marks = [POLICY_MARKS["Seasonal"][year] for year, _, _, season_label in POLICY_EVENTS if season_label in shown_seasons]
+    if marks:
+        fig.update_layout(shapes=[shape for shape, _ in marks], annotations=[note for _, note in marks])
+  # short correlation summary between the indciators  (normalized Pearson r)
+    corr_texts = []
+    idx = [NORM_IDX[c] for c in selected]
+    if mode == "Monthly":
+        lo, hi = year_bounds(global_years, year_range)
+        norm, moments = global_norm, global_moments
+    else:
+        lo, hi = year_bounds(seasonal_years, year_range)
+        norm, moments = seasonal_norm, seasonal_moments
+    # flat columns just come out as nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # no rows dropped, so the prefix sums give every pair's r for the window directly
+        # (unless a gap earlier in the column has turned its running sums into nan, then the fallback handles it)
+        if mask.all() and np.isfinite(moments[0][hi, idx]).all():
+            corr = window_corr(moments, lo, hi, idx)
+        else:
+            # some rows had gaps: one corrcoef over the same rows as plot_df
+            corr = np.corrcoef(norm[lo:hi, idx][mask].T)
+
+    # every pair just reads its r off the one matrix above
+    for (i, a), (j, b) in combinations(enumerate(selected), 2):
+        try:
+            r = corr[i, j]
+            strength = "strong" if abs(r) > 0.7 else "moderate" if abs(r) > 0.4 else "weak"
+            direction = "positive" if r > 0 else "negative"
+            corr_texts.append(f"• {a} & {b}: r = {r:.2f} ({strength}, {direction} correlation)")
+        except Exception:
+            corr_texts.append(f"• {a} & {b}: correlation unavailable")
+
+    return fig.to_dict(), tuple(corr_texts)
+
+# Updates global graph and summary panel in real time
 @app.callback(
     Output('global-graph', 'figure'),
-    Output('explanation-box', 'children'),
     Output('summary-panel', 'children'),
     Input('global-checklist', 'value'),
     Input('global-slider', 'value'),
     Input('view-mode', 'value'),
-    Input('theme-toggle', 'value')
+    State('theme-toggle', 'value')
 )
 def update_global(selected, year_range, mode, theme):
-    # Raw value mapping for users to see when they hover tooltips
-    raw_mapping = {
-        'norm_co2': 'co2_anomaly',
-        'norm_land_ocean_temp': 'land_ocean_anomaly',
-        'norm_land_temp': 'land_anomaly',
-        'norm_sea_level': 'msl_mm'
-    }
-
-    # to get the correct time window i use filtering 
-    dff = raw_global[(raw_global["year"] >= year_range[0]) & (raw_global["year"] <= year_range[1])]
-    dff_season = seasonal_avg[(seasonal_avg["year"] >= year_range[0]) & (seasonal_avg["year"] <= year_range[1])]
-    use_df = dff.copy() if mode == "Monthly" else dff_season.copy()
-
-    # time axis for either the month view mode selected or the seasonal one
-    use_df["X"] = use_df["Date"] if mode == "Monthly" else use_df["Season"] + " " + use_df["year"].astype(str)
-
-    # setting up hover tooltips with raw values
-    hover_data = {}
-    for col in selected:
-        if col in raw_mapping and raw_mapping[col] in use_df.columns:
-            hover_data[raw_mapping[col]] = True
-
-    # Final filtered DataFrame for plotting
-    plot_df = use_df[["X", "year"] + selected + [raw_mapping[c] for c in selected if c in raw_mapping]].dropna()
-
-    # Create the figure
-    fig = px.line(
-        plot_df,
-        x="X",
-        y=selected,
-        labels={"X": "Year","value": "Normalized Value (0–1)", "variable": "Indicator"},
-        color_discrete_sequence=['#0072B2', '#D55E00', '#009E73', '#CC79A7'],
-        title=f"Climate Trends Over Time ({mode})",
-        hover_data=hover_data
-    )
-    
-    raw_global['Season_Order'] = raw_global['Season'].map({'DJF': 0, 'MAM': 1, 'JJA': 2, 'SON': 3})
-    raw_global['X'] = raw_global['Season'] + ' ' + raw_global['year'].astype(str)
+    fig_dict, corr_texts = build_global_figure(tuple(selected), tuple(year_range), mode)
+    fig = with_theme(fig_dict, theme)
 
-    
+    return fig, html.Ul([html.Li(text) for text in corr_texts])
 
-    # Annotating global climate events in both Monthly and Seasonal modes
-    policy_events = {
-        1997: {"label": "Kyoto Protocol", "month": 12},
-        2015: {"label": "Paris Agreement", "month": 12},
-        2020: {"label": "COVID Drop", "month": 4}
-    }
-
-    for year, event in policy_events.items():
-        label = event["label"]
-        month = event["month"]
-        season = tag_season(month)
-        season_label = f"{season} {year}"
-        
-        if mode == "Monthly":
-            # Add annotation only if year is in selected range
-            if year_range[0] <= year <= year_range[1]:
-                date = pd.to_datetime(f"{year}-{month:02d}-01")
-                fig.add_vline(x=date, line_dash="dash", line_color="gray")
-                fig.add_annotation(
-                    x=date,
-                    y=1.05,
-                    yref="paper",
-                    text=label,
-                    showarrow=True,
-                    ax=0,
-                    ay=-30,
-                    font=dict(size=10)
-                )
-        else:  # Seasonal mode
-            if season_label in plot_df["X"].values:
-                fig.add_vline(x=season_label, line_dash="dash", line_color="gray")
-                fig.add_annotation(
-                    x=season_label,
-                    y=1.05,
-                    yref="paper",
-                    text=label,
-                    showarrow=True,
-                    ax=0,
-                    ay=-30,
-                    font=dict(size=10)
-                )
-    # Explanation box to make it simpler to undertsand the data for users
-    explanation = html.Div([
-
-        html.P("🌍 This dashboard compares key climate indicators that reflect human impact on the Earth’s climate system."),
-        html.Ul([
-            html.Li(["🌱",html.B("CO₂ Emissions"),": Carbon dioxide ( e.g., from fossil fuels) traps heat in the atmosphere. More CO₂ → more warming."]),
-            html.Li(["🌡️",html.B("Temperature Anomalies"),": How much temperatures deviate from historical normals, indicating warming trends."]),
-            html.Li(["🌊",html.B("Sea Level Changes"),": Driven by ice melt and thermal expansion of seawater as it warms."])
-        ]),
-
-        html.P("You are viewing normalized values (range from 0 to 1), which means each climate indicator—CO₂ emissions (Mt), temperature anomalies (°C), and sea level (mm)—has been scaled to the same range for easy comparison."),
-        html.P("➤ This allows you to directly compare trends, even though the original units are very different."),
-        html.P("➤ Hover over the lines to see the actual (raw) values for each year."),
-        html.P("➤ The graph highlights how these indicators have changed over time, focuses on the last 30 years."),
-        html.P([
-            "📍 Three key global events are marked on the chart:",
-            html.Ul([
-                html.Li([
-                    html.B("Kyoto Protocol (Dec 1997): "),
-                    "An international treaty committing industrialized countries to reduce emissions. You may notice a delayed but visible slowing in emission growth after this point."
-                ]),
-                html.Li([
-                    html.B("Paris Agreement (Dec 2015): "),
-                    "A global framework to limit warming to below 2°C. Although targets were set, the data shows only minor reductions or stabilization in trends after this agreement."
-                ]),
-                html.Li([
-                    html.B("COVID Drop (Spring 2020): "),
-                    "Global lockdowns may have led to temporary emissions drops and some irregularities in sea level due to the economic slowdown. These appear as short-term dips in the data."
-                ]),
-            ]),
-            "These annotations help you connect major global actions or disruptions to changes in the data. Look for temporary changes or delayed responses in the trendlines near these years."
-        ]),
-        html.P("➤ You can use the legend side of the chart to show or hide each indicator.")
-    ])
-  # short correlation summary between the indciators  (normalized Pearson r)
-    corr_texts = []
-    norm_corr_df = plot_df[["X"] + selected].copy()
-    for col in selected:
-        norm_corr_df[col] = (norm_corr_df[col] - norm_corr_df[col].mean()) / norm_corr_df[col].std()
-
-    for i in range(len(selected)):
-        for j in range(i + 1, len(selected)):
-            a, b = selected[i], selected[j]
-            try:
-                r = np.corrcoef(norm_corr_df[a], norm_corr_df[b])[0, 1]
-                strength = "strong" if abs(r) > 0.7 else "moderate" if abs(r) > 0.4 else "weak"
-                direction = "positive" if r > 0 else "negative"
-                corr_texts.append(f"• {a} & {b}: r = {r:.2f} ({strength}, {direction} correlation)")
-            except Exception:
-                corr_texts.append(f"• {a} & {b}: correlation unavailable")
-
-    return fig, explanation, html.Ul([html.Li(text) for text in corr_texts])
+# writes the export straight from arrow memory with pyarrow's C csv writer instead of building a pandas to_csv string
+# (Date goes out as a plain calendar date like before, the row index is left out)
+# rows are written and gzipped 1000 at a time, so the full csv text never sits in memory
+def write_export_csv(df, bio):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    date_i = table.schema.get_field_index("Date")
+    table = table.set_column(date_i, "Date", table.column(date_i).cast(pa.date32()))
+    with gzip.GzipFile(fileobj=bio, mode="wb") as gz:
+        pa_csv.write_csv(table, gz, pa_csv.WriteOptions(batch_size=1000))
 
 # to download the csv file to see the preprocessed dataset
 @app.callback(
@@ -336,83 +499,92 @@ def export_csv(n_clicks, year_range):
 
     #filter the global data by year range
     try:
-        export_df = raw_global[(raw_global['year'] >= year_range[0]) & (raw_global['year'] <= year_range[1])]
-        return dcc.send_data_frame(export_df.to_csv, filename="filtered_climate_data.csv")
+        export_df = global_window(*year_range)
+        return dcc.send_bytes(lambda bio: write_export_csv(export_df, bio), "filtered_climate_data.csv.gz")
     except Exception as e:
         # incase failing to export the csv
         print(f"Export failed: {e}")
         return no_update
 
-#  hemisphere animated graph callback to animaate over time 
-@app.callback(
-    Output('hemi-animation', 'figure'),
-    Input('hemi-checklist', 'value'),
-    Input('theme-toggle', 'value'),
-    Input('hemi-hemi-dropdown', 'value')
-)
-def update_hemi_graph( selected_inds, theme , hemi):
-    if not selected_inds:
-        return go.Figure().update_layout(
-            title="Please select at least one indicator to display.",
-            template="plotly_dark" if theme == "Dark" else "plotly_white"
-        )
-
-    raw_hemi = pd.read_csv("hemispheric_merged.csv")
-    #take mean of monthly data
-    hemi_df_grouped = raw_hemi.groupby([ "year"]).mean(numeric_only=True).reset_index()
-       # Defining variable name for legend and tooltip
-    label_map = {
-        "norm_north_co2": "CO₂ Anomaly (NH)",
-        "norm_north_land": "Land Temp (NH)",
-        "norm_north_land_ocean": "Land-Ocean Temp (NH)",
-        "norm_msl_north": "Sea Level (NH)",
-        "norm_south_co2": "CO₂ Anomaly (SH)",
-        "norm_south_land": "Land Temp (SH)",
-        "norm_south_land_ocean": "Land-Ocean Temp (SH)",
-        "norm_msl_south": "Sea Level (SH)" 
-    }
-
-    color_map = {
-        "norm_north_co2": "#0072B2", "norm_north_land": "#D55E00", "norm_north_land_ocean": "#009E73", "norm_msl_north": "#CC79A7",
-        "norm_south_co2": "#0072B2", "norm_south_land": "#D55E00", "norm_south_land_ocean": "#009E73", "norm_msl_south": "#CC79A7"
-    }
+# dtypes plotly.js can decode from a typed array (no 64-bit ints, those get narrowed like plotly's own encoder does)
+TYPED_ARRAY_DTYPES = {"i1", "u1", "i2", "u2", "i4", "u4", "f4", "f8"}
+
+# plotly.js typed-array form of a numpy array, the same compact base64 encoding fig.to_dict() gives trace arrays
+# (the hemisphere frames are plain dicts, so they're encoded here)
+def typed_array(a):
+    if a.dtype.kind in "iu" and a.dtype.itemsize == 8:
+        a = a.astype(np.int32 if a.dtype.kind == "i" else np.uint32)
+    a = a.astype(a.dtype.newbyteorder("<"), copy=False)
+    code = a.dtype.str[1:]
+    if code not in TYPED_ARRAY_DTYPES:
+        raise ValueError(f"plotly.js can't read {a.dtype} typed arrays")
+    return {"dtype": code, "bdata": base64.b64encode(a.tobytes()).decode("ascii")}
+
+# slider steps only depend on the years, so they're built once and shared by every hemisphere figure
+@lru_cache(maxsize=4)
+def hemi_slider_steps(year_strs):
+    return [
+        {"args": [[y], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}],
+         "label": y, "method": "animate"} for y in year_strs
+    ]
+
+# Defining variable name for legend and tooltip
+HEMI_LABELS = {
+    "norm_north_co2": "CO₂ Anomaly (NH)",
+    "norm_north_land": "Land Temp (NH)",
+    "norm_north_land_ocean": "Land-Ocean Temp (NH)",
+    "norm_msl_north": "Sea Level (NH)",
+    "norm_south_co2": "CO₂ Anomaly (SH)",
+    "norm_south_land": "Land Temp (SH)",
+    "norm_south_land_ocean": "Land-Ocean Temp (SH)",
+    "norm_msl_south": "Sea Level (SH)" 
+}
+
+HEMI_COLORS = {
+    "norm_north_co2": "#0072B2", "norm_north_land": "#D55E00", "norm_north_land_ocean": "#009E73", "norm_msl_north": "#CC79A7",
+    "norm_south_co2": "#0072B2", "norm_south_land": "#D55E00", "norm_south_land_ocean": "#009E73", "norm_msl_south": "#CC79A7"
+}
+
+# builds the animated hemisphere figure, cached per (indicators, hemisphere) so a theme flip doesn't redo the frames
+@cache.memoize(timeout=300)
+def build_hemi_figure(selected_inds, hemi):
+    # yearly means for this hemisphere, precomputed at import (see HEMI)
+    years, hemi_matrix, col_idx = HEMI[hemi]
+    # frames below are just prefix slices of these arrays
+    year_strs = tuple(years.astype(str).tolist())
+    # (years x selected indicators) float32 matrix, column j is indicator j
+    m = hemi_matrix[:, [col_idx[ind] for ind in selected_inds]]
 
     fig = go.Figure()
     #  Add lines for firdy years data for initial display  
-    initial_year = hemi_df_grouped["year"].min()
-    for ind in selected_inds:
-        subset = hemi_df_grouped[hemi_df_grouped["year"] <= initial_year]
+    for j, ind in enumerate(selected_inds):
         fig.add_trace(go.Scatter(
-            x=subset["year"],
-            y=subset[ind],
+            x=years[:1],
+            y=m[:1, j],
             mode="lines+markers",
-            name=label_map.get(ind, ind),
-            line=dict(color=color_map.get(ind, "#444")),
+            name=HEMI_LABELS.get(ind, ind),
+            line=dict(color=HEMI_COLORS.get(ind, "#444")),
             hovertemplate="%{y:.2f} (normalized)<br>Year: %{x}"
         ))        
       
     #  Create animation frames progressively for each year   
-    frames = []
-    for year in hemi_df_grouped["year"]:
-        data = []
-        for ind in selected_inds:
-            subset = hemi_df_grouped[hemi_df_grouped["year"] <= year]
-            data.append(go.Scatter(
-                x=subset["year"],
-                y=subset[ind],
-                mode="lines+markers",
-                name=label_map.get(ind, ind),
-                line=dict(color=color_map.get(ind, "#444"))         
-           ))
-        frames.append(go.Frame(data=data, name=str(year)))
-
-    fig.frames = frames
+    # frames only carry the growing x/y, plotly merges them onto the traces above
+    # so name/mode/colour don't get resent for every single year
+    # (plain dicts, years x indicators go.Scatter/go.Frame objects were most of the build time just in validation)
+    trace_ids = list(range(len(selected_inds)))
+    frames = [
+        {
+            "data": [{"type": "scatter", "x": typed_array(years[:i + 1]), "y": typed_array(m[:i + 1, j])} for j in trace_ids],
+            "traces": trace_ids,
+            "name": year_strs[i],
+        }
+        for i in range(len(years))
+    ]
 # Layout of the play pause button andd slider 
     fig.update_layout(
         title=f"{hemi.upper()} Hemisphere – Normalized Indicators Over Time",
         xaxis_title="Year",
         yaxis_title="Normalized Value (0–1)",
-        template="plotly_dark" if theme == "Dark" else "plotly_white",
         hovermode="x unified",
         updatemenus=[{
             "buttons": [
@@ -426,15 +598,57 @@ def update_hemi_graph( selected_inds, theme , hemi):
             "y":1.15, "yanchor": "top",
         }],
         sliders=[{
-            "steps": [
-                {"args": [[str(year)], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}],
-                 "label": str(year), "method": "animate"} for year in hemi_df_grouped["year"]
-            ],
+            "steps": hemi_slider_steps(year_strs),
             "x": 0.05, "len": 0.9,
             "xanchor": "left", "y": -0.2, "yanchor": "bottom"
         }]
     )
-    return fig
+    return {**fig.to_dict(), "frames": frames}
+
+#  hemisphere animated graph callback to animaate over time 
+@app.callback(
+    Output('hemi-animation', 'figure'),
+    Input('hemi-checklist', 'value'),
+    State('theme-toggle', 'value'),
+    Input('hemi-hemi-dropdown', 'value')
+)
+def update_hemi_graph( selected_inds, theme , hemi):
+    if not selected_inds:
+        return go.Figure().update_layout(
+            title="Please select at least one indicator to display.",
+            template="plotly_dark" if theme == "Dark" else "plotly_white"
+        )
+
+    return with_theme(build_hemi_figure(tuple(selected_inds), hemi), theme)
+
+# flipping the theme just swaps the template on whichever graph is showing, right in the browser
+# (no server round trip; the template dicts ride along once with the layout in the theme-templates store)
+THEME_SWAP_JS = """
+function(theme, templates, fig) {
+    if (!fig || !fig.layout) {
+        return window.dash_clientside.no_update;
+    }
+    return {...fig, layout: {...fig.layout, template: templates[theme === "Dark" ? "Dark" : "Light"]}};
+}
+"""
+
+app.clientside_callback(
+    THEME_SWAP_JS,
+    Output('global-graph', 'figure', allow_duplicate=True),
+    Input('theme-toggle', 'value'),
+    State('theme-templates', 'data'),
+    State('global-graph', 'figure'),
+    prevent_initial_call=True
+)
+
+app.clientside_callback(
+    THEME_SWAP_JS,
+    Output('hemi-animation', 'figure', allow_duplicate=True),
+    Input('theme-toggle', 'value'),
+    State('theme-templates', 'data'),
+    State('hemi-animation', 'figure'),
+    prevent_initial_call=True
+)
 # to be deployed adding the server port accordingly docker 
 server = app.server  
 